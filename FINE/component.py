@@ -1034,18 +1034,19 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar, capVar = getattr(pyM, opVarName + '_' + abbrvName), getattr(pyM, 'cap_' + abbrvName)
         constrSet2 = getattr(pyM, constrSetName + '2_' + abbrvName)
+        # Time series of the components in the constraint set, converted once to {loc: {(p, t): value}} dictionaries
+        rateDict = {compName: getattr(compDict[compName], opRateName).to_dict()
+                    for compName in {compName for _, compName in constrSet2}}
 
         if not pyM.hasSegmentation:
             factor = 1 if isStateOfCharge else esM.hoursPerTimeStep
             def op2(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] == capVar[loc, compName] * rate[loc][p, t] * factor
+                return opVar[loc, compName, p, t] == capVar[loc, compName] * rateDict[compName][loc][p, t] * factor
             setattr(pyM, constrName + '2_' + abbrvName, pyomo.Constraint(constrSet2, pyM.timeSet, rule=op2))
         else:
             factor = (esM.hoursPerSegment/esM.hoursPerSegment).to_dict() if isStateOfCharge else esM.hoursPerSegment.to_dict()
             def op2(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] == capVar[loc, compName] * rate[loc][p, t] * factor[p,t]
+                return opVar[loc, compName, p, t] == capVar[loc, compName] * rateDict[compName][loc][p, t] * factor[p,t]
             setattr(pyM, constrName + '2_' + abbrvName, pyomo.Constraint(constrSet2, pyM.timeSet, rule=op2))
 
     def operationMode3(self, pyM, esM, constrName, constrSetName, opVarName, opRateName='processedOperationRateMax',
@@ -1063,18 +1064,19 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar, capVar = getattr(pyM, opVarName + '_' + abbrvName), getattr(pyM, 'cap_' + abbrvName)
         constrSet3 = getattr(pyM, constrSetName + '3_' + abbrvName)
+        # Time series of the components in the constraint set, converted once to {loc: {(p, t): value}} dictionaries
+        rateDict = {compName: getattr(compDict[compName], opRateName).to_dict()
+                    for compName in {compName for _, compName in constrSet3}}
 
         if not pyM.hasSegmentation:
             factor = 1 if isStateOfCharge else esM.hoursPerTimeStep
             def op3(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] <= capVar[loc, compName] * rate[loc][p, t] * factor
+                return opVar[loc, compName, p, t] <= capVar[loc, compName] * rateDict[compName][loc][p, t] * factor
             setattr(pyM, constrName + '3_' + abbrvName, pyomo.Constraint(constrSet3, pyM.timeSet, rule=op3))
         else:
             factor = (esM.hoursPerSegment/esM.hoursPerSegment).to_dict() if isStateOfCharge else esM.hoursPerSegment.to_dict()
             def op3(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] <= capVar[loc, compName] * rate[loc][p, t] * factor[p,t]
+                return opVar[loc, compName, p, t] <= capVar[loc, compName] * rateDict[compName][loc][p, t] * factor[p,t]
             setattr(pyM, constrName + '3_' + abbrvName, pyomo.Constraint(constrSet3, pyM.timeSet, rule=op3))
 
     def operationMode4(self, pyM, esM, constrName, constrSetName, opVarName, opRateName='processedOperationRateFix'):
@@ -1088,16 +1090,18 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + '_' + abbrvName)
         constrSet4 = getattr(pyM, constrSetName + '4_' + abbrvName)
+        # Time series of the components in the constraint set, converted once to {loc: {(p, t): value}} dictionaries
+        rateDict = {compName: getattr(compDict[compName], opRateName).to_dict()
+                    for compName in {compName for _, compName in constrSet4}}
 
         if not pyM.hasSegmentation:
             def op4(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] == rate[loc][p, t]
+                return opVar[loc, compName, p, t] == rateDict[compName][loc][p, t]
             setattr(pyM, constrName + '4_' + abbrvName, pyomo.Constraint(constrSet4, pyM.timeSet, rule=op4))
         else:
+            timeStepsPerSegment = esM.timeStepsPerSegment.to_dict()
             def op4(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] == rate[loc][p, t] * esM.timeStepsPerSegment.to_dict()[p, t]
+                return opVar[loc, compName, p, t] == rateDict[compName][loc][p, t] * timeStepsPerSegment[p, t]
             setattr(pyM, constrName + '4_' + abbrvName, pyomo.Constraint(constrSet4, pyM.timeSet, rule=op4))
 
     def operationMode5(self, pyM, esM, constrName, constrSetName, opVarName, opRateName='processedOperationRateMax'):
@@ -1111,16 +1115,18 @@ class ComponentModel(metaclass=ABCMeta):
         compDict, abbrvName = self.componentsDict, self.abbrvName
         opVar = getattr(pyM, opVarName + '_' + abbrvName)
         constrSet5 = getattr(pyM, constrSetName + '5_' + abbrvName)
+        # Time series of the components in the constraint set, converted once to {loc: {(p, t): value}} dictionaries
+        rateDict = {compName: getattr(compDict[compName], opRateName).to_dict()
+                    for compName in {compName for _, compName in constrSet5}}
 
         if not pyM.hasSegmentation:
             def op5(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] <= rate[loc][p, t]
+                return opVar[loc, compName, p, t] <= rateDict[compName][loc][p, t]
             setattr(pyM, constrName + '5_' + abbrvName, pyomo.Constraint(constrSet5, pyM.timeSet, rule=op5))
         else:
+            timeStepsPerSegment = esM.timeStepsPerSegment.to_dict()
             def op5(pyM, loc, compName, p, t):
-                rate = getattr(compDict[compName], opRateName)
-                return opVar[loc, compName, p, t] <= rate[loc][p, t] * esM.timeStepsPerSegment.to_dict()[p, t]
+                return opVar[loc, compName, p, t] <= rateDict[compName][loc][p, t] * timeStepsPerSegment[p, t]
             setattr(pyM, constrName + '5_' + abbrvName, pyomo.Constraint(constrSet5, pyM.timeSet, rule=op5))
 
 
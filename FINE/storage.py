@@ -282,10 +282,10 @@ class Storage(Component):
         
         if self.partLoadMin is not None:
             if self.fullChargeOpRateMax is not None:
-                if ((self.fullChargeOpRateMax > 0) & (self.fullChargeOpRateMax < self.partLoadMin)).any().any():
+                if np.any((self.fullChargeOpRateMax.values > 0) & (self.fullChargeOpRateMax.values < self.partLoadMin)):
                     raise ValueError('"fullChargeOpRateMax" needs to be higher than "partLoadMin" or 0 for component ' + name )
             if self.fullChargeOpRateFix is not None:
-                if ((self.fullChargeOpRateFix > 0) & (self.fullChargeOpRateFix < self.partLoadMin)).any().any():
+                if np.any((self.fullChargeOpRateFix.values > 0) & (self.fullChargeOpRateFix.values < self.partLoadMin)):
                     raise ValueError('"fullChargeOpRateFix" needs to be higher than "partLoadMin" or 0 for component ' + name )
 
 
@@ -313,11 +313,13 @@ class Storage(Component):
 
         # Set locational eligibility
         timeSeriesData = None
-        tsNb = sum([0 if data is None else 1 for data in [self.fullChargeOpRateMax, self.fullChargeOpRateFix,
-                                                          self.fullDischargeOpRateMax, self.fullDischargeOpRateFix]])
-        if tsNb > 0:
-            timeSeriesData = sum([data for data in [self.fullChargeOpRateMax, self.fullChargeOpRateFix,
-                                 self.fullDischargeOpRateMax, self.fullDischargeOpRateFix] if data is not None])
+        rates = [data for data in [self.fullChargeOpRateMax, self.fullChargeOpRateFix,
+                                   self.fullDischargeOpRateMax, self.fullDischargeOpRateFix] if data is not None]
+        if rates:
+            # All rates share the same time index; the columns are aligned to the ones of the first rate
+            index, columns = rates[0].index, rates[0].columns
+            timeSeriesData = pd.DataFrame(np.add.reduce([data[columns].values for data in rates]),
+                                          index=index, columns=columns)
         self.locationalEligibility = \
             utils.setLocationalEligibility(esM, self.locationalEligibility, self.capacityMax, self.capacityFix,
                                            self.isBuiltFix, self.hasCapacityVariable, timeSeriesData)
@@ -404,6 +406,12 @@ class StorageModel(ComponentModel):
 
         compDict = self.componentsDict
 
+        # Evaluate the component flags which are relevant for the case differentiation only once:
+        # (doPreciseTsaModeling, socOffsetUp >= 0, socOffsetDown >= 0, isPeriodicalStorage)
+        flags = {compName: (comp.doPreciseTsaModeling, comp.socOffsetUp >= 0, comp.socOffsetDown >= 0,
+                            comp.isPeriodicalStorage)
+                 for compName, comp in compDict.items()}
+
         # Declare design variable sets
         self.declareDesignVarSet(pyM)
         self.declareContinuousDesignVarSet(pyM)
@@ -414,30 +422,37 @@ class StorageModel(ComponentModel):
         self.declareOpVarSet(esM, pyM)
         self.declareOperationBinarySet(pyM)
         
-        if pyM.hasTSA:
-            varSet = getattr(pyM, 'operationVarSet_' + self.abbrvName)
+        varSet = getattr(pyM, 'operationVarSet_' + self.abbrvName)
 
-            def initVarSimpleTSASet(pyM):
-                return ((loc, compName) for loc, compName in varSet if not compDict[compName].doPreciseTsaModeling)
+        # Dictionary which lists all components of the modeling class at one location which are connected to a commodity
+        opVarDict = getattr(pyM, 'operationVarDict_' + self.abbrvName)
+        setattr(pyM, 'operationVarDictCommodity_' + self.abbrvName,
+                {(loc, commod): [compName for compName in opVarDict[loc] if compDict[compName].commodity == commod]
+                 for loc in esM.locations for commod in esM.commodities})
+
+        if pyM.hasTSA:
             setattr(pyM, 'varSetSimple_' + self.abbrvName,
-                    pyomo.Set(dimen=2, initialize=initVarSimpleTSASet))
-    
-            def initVarPreciseTSASet(pyM):
-                return ((loc, compName) for loc, compName in varSet if compDict[compName].doPreciseTsaModeling)
+                    pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in varSet
+                                                   if not flags[compName][0]]))
             setattr(pyM, 'varSetPrecise_' + self.abbrvName,
-                    pyomo.Set(dimen=2, initialize=initVarPreciseTSASet))
+                    pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in varSet
+                                                   if flags[compName][0]]))
+            setattr(pyM, 'designDimensionVarSetSimple_' + self.abbrvName,
+                    pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in
+                                                   getattr(pyM, 'designDimensionVarSet_' + self.abbrvName)
+                                                   if not flags[compName][0]]))
+            setattr(pyM, 'designDimensionVarSetPrecise_' + self.abbrvName,
+                    pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in
+                                                   getattr(pyM, 'designDimensionVarSet_' + self.abbrvName)
+                                                   if flags[compName][0]]))
+            setattr(pyM, 'varSetPeriodical_' + self.abbrvName,
+                    pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in varSet
+                                                   if flags[compName][3]]))
 
-        def initOffsetUpSet(pyM):
-            return ((loc, compName) for loc, compName in getattr(pyM, 'operationVarSet_' + self.abbrvName)
-                if compDict[compName].socOffsetUp >= 0)
         setattr(pyM, 'varSetOffsetUp_' + self.abbrvName,
-                pyomo.Set(dimen=2, initialize=initOffsetUpSet))  
-
-        def initOffsetDownSet(pyM):
-            return ((loc, compName) for loc, compName in getattr(pyM, 'operationVarSet_' + self.abbrvName)
-                if compDict[compName].socOffsetDown >= 0)
+                pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in varSet if flags[compName][1]]))
         setattr(pyM, 'varSetOffsetDown_' + self.abbrvName,
-                pyomo.Set(dimen=2, initialize=initOffsetDownSet))        
+                pyomo.Set(dimen=2, initialize=[(loc, compName) for loc, compName in varSet if flags[compName][2]]))
 
         # Declare sets for case differentiation of operating modes
         # * Charge operation
@@ -539,18 +554,27 @@ class StorageModel(ComponentModel):
         SOC = getattr(pyM, 'stateOfCharge_' + abbrvName)
         chargeOp, dischargeOp = getattr(pyM, 'chargeOp_' + abbrvName), getattr(pyM, 'dischargeOp_' + abbrvName)
         opVarSet = getattr(pyM, 'operationVarSet_' + abbrvName)
+        # Component parameters which are constant over all time steps, evaluated once before the rule is called
+        selfDischargeBase = {compName: 1 - comp.selfDischarge for compName, comp in compDict.items()}
+        chargeEfficiency = {compName: comp.chargeEfficiency for compName, comp in compDict.items()}
+        dischargeEfficiency = {compName: comp.dischargeEfficiency for compName, comp in compDict.items()}
+
+        if not pyM.hasSegmentation:
+            selfDischargeFactor = {compName: base ** esM.hoursPerTimeStep
+                                   for compName, base in selfDischargeBase.items()}
+
+            def connectSOCs(pyM, loc, compName, p, t):
+                return (SOC[loc, compName, p, t+1] - SOC[loc, compName, p, t] * selfDischargeFactor[compName] ==
+                        chargeOp[loc, compName, p, t] * chargeEfficiency[compName] -
+                        dischargeOp[loc, compName, p, t] / dischargeEfficiency[compName])
+        else:
+            hoursPerSegment = esM.hoursPerSegment.to_dict()
 
-        def connectSOCs(pyM, loc, compName, p, t):
-            if not pyM.hasSegmentation:
-                return (SOC[loc, compName, p, t+1] - SOC[loc, compName, p, t] *
-                        (1 - compDict[compName].selfDischarge) ** esM.hoursPerTimeStep ==
-                        chargeOp[loc, compName, p, t] * compDict[compName].chargeEfficiency -
-                        dischargeOp[loc, compName, p, t] / compDict[compName].dischargeEfficiency)
-            else:
+            def connectSOCs(pyM, loc, compName, p, t):
                 return (SOC[loc, compName, p, t+1] - SOC[loc, compName, p, t] *
-                        (1 - compDict[compName].selfDischarge) ** esM.hoursPerSegment.to_dict()[p, t] ==
-                        chargeOp[loc, compName, p, t] * compDict[compName].chargeEfficiency -
-                        dischargeOp[loc, compName, p, t] / compDict[compName].dischargeEfficiency)
+                        selfDischargeBase[compName] ** hoursPerSegment[p, t] ==
+                        chargeOp[loc, compName, p, t] * chargeEfficiency[compName] -
+                        dischargeOp[loc, compName, p, t] / dischargeEfficiency[compName])
         setattr(pyM, 'ConstrConnectSOC_' + abbrvName, pyomo.Constraint(opVarSet, pyM.timeSet, rule=connectSOCs))
 
     def cyclicState(self, pyM, esM):
@@ -574,24 +598,27 @@ class StorageModel(ComponentModel):
         :param esM: EnergySystemModel instance representing the energy system in which the component should be modeled.
         :type esM: esM - EnergySystemModel class instance
         """
-        abbrvName = self.abbrvName
+        compDict, abbrvName = self.componentsDict, self.abbrvName
         opVarSet = getattr(pyM, 'operationVarSet_' + abbrvName)
         SOC = getattr(pyM, 'stateOfCharge_' + abbrvName)
         offsetUp = getattr(pyM, 'stateOfChargeOffsetUp_' + abbrvName)
         offsetDown = getattr(pyM, 'stateOfChargeOffsetDown_' + abbrvName)
+        # Components for which the offset variables are declared (cf. varSetOffsetUp/varSetOffsetDown)
+        offsetUpComps = {compName for compName, comp in compDict.items() if comp.socOffsetUp >= 0}
+        offsetDownComps = {compName for compName, comp in compDict.items() if comp.socOffsetDown >= 0}
 
         if not pyM.hasTSA:
             def cyclicState(pyM, loc, compName):
-                offsetUp_ = offsetUp[loc, compName, 0] if (loc, compName, 0) in offsetUp else 0
-                offsetDown_ = offsetDown[loc, compName, 0] if (loc, compName, 0) in offsetDown else 0
+                offsetUp_ = offsetUp[loc, compName, 0] if compName in offsetUpComps else 0
+                offsetDown_ = offsetDown[loc, compName, 0] if compName in offsetDownComps else 0
                 return SOC[loc, compName, 0, 0] == \
                     SOC[loc, compName, 0, esM.timeStepsPerPeriod[-1] + 1] + (offsetUp_ - offsetDown_)
         else:
             SOCInter = getattr(pyM, 'stateOfChargeInterPeriods_' + abbrvName)
             def cyclicState(pyM, loc, compName):
                 tLast = esM.interPeriodTimeSteps[-1]
-                offsetUp_ = offsetUp[loc, compName, tLast] if (loc, compName, tLast) in offsetUp else 0
-                offsetDown_ = offsetDown[loc, compName, tLast] if (loc, compName, tLast) in offsetDown else 0
+                offsetUp_ = offsetUp[loc, compName, tLast] if compName in offsetUpComps else 0
+                offsetDown_ = offsetDown[loc, compName, tLast] if compName in offsetDownComps else 0
                 return SOCInter[loc, compName, 0] == \
                     SOCInter[loc, compName, tLast] + (offsetUp_ - offsetDown_)
         setattr(pyM, 'ConstrCyclicState_' + abbrvName, pyomo.Constraint(opVarSet, rule=cyclicState))
@@ -619,12 +646,16 @@ class StorageModel(ComponentModel):
         chargeOp, capVar = getattr(pyM, 'chargeOp_' + abbrvName), getattr(pyM, 'cap_' + abbrvName)
         capVarSet = getattr(pyM, 'designDimensionVarSet_' + abbrvName)
 
+        periodOccurrences = esM.periodOccurrences
+
         def cyclicLifetime(pyM, loc, compName):
-            return (sum(chargeOp[loc, compName, p, t] * esM.periodOccurrences[p] for p, t in pyM.timeSet) /
+            comp = compDict[compName]
+            if comp.cyclicLifetime is None:
+                return pyomo.Constraint.Skip
+            return (pyomo.quicksum(chargeOp[loc, compName, p, t] * periodOccurrences[p] for p, t in pyM.timeSet) /
                     esM.numberOfYears <= capVar[loc, compName] *
-                    (compDict[compName].stateOfChargeMax - compDict[compName].stateOfChargeMin) *
-                    compDict[compName].cyclicLifetime / compDict[compName].economicLifetime[loc]
-                    if compDict[compName].cyclicLifetime is not None else pyomo.Constraint.Skip)
+                    (comp.stateOfChargeMax - comp.stateOfChargeMin) *
+                    comp.cyclicLifetime / comp.economicLifetime[loc])
         setattr(pyM, 'ConstrCyclicLifetime_' + abbrvName, pyomo.Constraint(capVarSet, rule=cyclicLifetime))
 
     def connectInterPeriodSOC(self, pyM, esM):
@@ -648,27 +679,27 @@ class StorageModel(ComponentModel):
         :type esM: esM - EnergySystemModel class instance
         """
         compDict, abbrvName = self.componentsDict, self.abbrvName
+        periodsOrder = tuple(int(p) for p in esM.periodsOrder)
         opVarSet = getattr(pyM, 'operationVarSet_' + abbrvName)
         SOC = getattr(pyM, 'stateOfCharge_' + abbrvName)
         SOCInter = getattr(pyM, 'stateOfChargeInterPeriods_' + abbrvName)
         offsetUp = getattr(pyM, 'stateOfChargeOffsetUp_' + abbrvName)
         offsetDown = getattr(pyM, 'stateOfChargeOffsetDown_' + abbrvName)
+        # Components for which the offset variables are declared (cf. varSetOffsetUp/varSetOffsetDown)
+        offsetUpComps = {compName for compName, comp in compDict.items() if comp.socOffsetUp >= 0}
+        offsetDownComps = {compName for compName, comp in compDict.items() if comp.socOffsetDown >= 0}
+        # Self-discharge over the length of one period and index of the last (virtual) state of charge in a period
+        periodHours = (esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep
+        periodSelfDischarge = {compName: (1 - comp.selfDischarge) ** periodHours for compName, comp in compDict.items()}
+        lastStep = (esM.segmentsPerPeriod[-1] if pyM.hasSegmentation else esM.timeStepsPerPeriod[-1]) + 1
 
         def connectInterSOC(pyM, loc, compName, pInter):
-            offsetUp_ = offsetUp[loc, compName, pInter] if (loc, compName, pInter) in offsetUp else 0
-            offsetDown_ = offsetDown[loc, compName, pInter] if (loc, compName, pInter) in offsetDown else 0
-            if not esM.pyM.hasSegmentation:
-                return SOCInter[loc, compName, pInter + 1] == \
-                    SOCInter[loc, compName, pInter] * (1 - compDict[compName].selfDischarge) ** \
-                    ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep) + \
-                    SOC[loc, compName, esM.periodsOrder[pInter], esM.timeStepsPerPeriod[-1] + 1] + \
-                    (offsetUp_ - offsetDown_)
-            else:
-                return SOCInter[loc, compName, pInter + 1] == \
-                    SOCInter[loc, compName, pInter] * (1 - compDict[compName].selfDischarge) ** \
-                    ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep) + \
-                    SOC[loc, compName, esM.periodsOrder[pInter], esM.segmentsPerPeriod[-1] + 1] + \
-                    (offsetUp_ - offsetDown_)
+            offsetUp_ = offsetUp[loc, compName, pInter] if compName in offsetUpComps else 0
+            offsetDown_ = offsetDown[loc, compName, pInter] if compName in offsetDownComps else 0
+            return SOCInter[loc, compName, pInter + 1] == \
+                SOCInter[loc, compName, pInter] * periodSelfDischarge[compName] + \
+                SOC[loc, compName, periodsOrder[pInter], lastStep] + \
+                (offsetUp_ - offsetDown_)
         setattr(pyM, 'ConstrInterSOC_' + abbrvName, pyomo.Constraint(opVarSet, esM.periods, rule=connectInterSOC))
 
     def intraSOCstart(self, pyM, esM):
@@ -709,14 +740,14 @@ class StorageModel(ComponentModel):
         :param esM: EnergySystemModel instance representing the energy system in which the component should be modeled.
         :type esM: esM - EnergySystemModel class instance
         """
-        compDict, abbrvName = self.componentsDict, self.abbrvName
-        opVarSet = getattr(pyM, 'operationVarSet_' + abbrvName)
+        abbrvName = self.abbrvName
+        periodicalSet = getattr(pyM, 'varSetPeriodical_' + abbrvName)
         SOCInter = getattr(pyM, 'stateOfChargeInterPeriods_' + abbrvName)
 
         def equalInterSOC(pyM, loc, compName, pInter):
-            return (SOCInter[loc, compName, pInter] == SOCInter[loc, compName, pInter + 1]
-                    if compDict[compName].isPeriodicalStorage else pyomo.Constraint.Skip)
-        setattr(pyM, 'ConstrEqualInterSOC_' + abbrvName, pyomo.Constraint(opVarSet, esM.periods, rule=equalInterSOC))
+            return SOCInter[loc, compName, pInter] == SOCInter[loc, compName, pInter + 1]
+        setattr(pyM, 'ConstrEqualInterSOC_' + abbrvName,
+                pyomo.Constraint(periodicalSet, esM.periods, rule=equalInterSOC))
 
     def minSOC(self, pyM):
         """
@@ -762,10 +793,15 @@ class StorageModel(ComponentModel):
         
         """
         compDict, abbrvName = self.componentsDict, self.abbrvName
+        periodsOrder = tuple(int(p) for p in esM.periodsOrder)
         varSimpleSet = getattr(pyM, 'varSetSimple_' + abbrvName)
+        capVarSimpleSet = getattr(pyM, 'designDimensionVarSetSimple_' + abbrvName)
         SOC, capVar = getattr(pyM, 'stateOfCharge_' + abbrvName), getattr(pyM, 'cap_' + abbrvName)
         SOCmax, SOCmin = getattr(pyM, 'stateOfChargeMax_' + abbrvName), getattr(pyM, 'stateOfChargeMin_' + abbrvName)
         SOCInter = getattr(pyM, 'stateOfChargeInterPeriods_' + abbrvName)
+        # Self-discharge over the length of one period
+        periodHours = (esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep
+        periodSelfDischarge = {compName: (1 - comp.selfDischarge) ** periodHours for compName, comp in compDict.items()}
 
         # The maximum (virtual) state of charge during a typical period is larger than all occurring (virtual)
         # states of charge in that period (the last time step is considered in the subsequent period for t=0).
@@ -783,30 +819,26 @@ class StorageModel(ComponentModel):
 
         # The state of charge at the beginning of one period plus the maximum (virtual) state of charge
         # during that period has to be smaller than the installed capacities multiplied with the relative maximum
-        # state of charge.
+        # state of charge (only for components with a capacity variable).
         def SOCMaxSimple(pyM, loc, compName, pInter):
-            if compDict[compName].hasCapacityVariable:
-                return (SOCInter[loc, compName, pInter] + SOCmax[loc, compName, esM.periodsOrder[pInter]]
-                        <= capVar[loc, compName] * compDict[compName].stateOfChargeMax)
-            else:
-                pyomo.Constraint.Skip
+            return (SOCInter[loc, compName, pInter] + SOCmax[loc, compName, periodsOrder[pInter]]
+                    <= capVar[loc, compName] * compDict[compName].stateOfChargeMax)
         setattr(pyM, 'ConstrSOCMaxSimple_' + abbrvName,
-                pyomo.Constraint(varSimpleSet, esM.periods, rule=SOCMaxSimple))
+                pyomo.Constraint(capVarSimpleSet, esM.periods, rule=SOCMaxSimple))
 
         # The state of charge at the beginning of one period plus the minimum (virtual) state of charge
         # during that period has to be larger than the installed capacities multiplied with the relative minimum
         # state of charge.
         def SOCMinSimple(pyM, loc, compName, pInter):
-            if compDict[compName].hasCapacityVariable:
-                return (SOCInter[loc, compName, pInter] * (1 - compDict[compName].selfDischarge) **
-                        ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep)
-                        + SOCmin[loc, compName, esM.periodsOrder[pInter]]
-                        >= capVar[loc, compName] * compDict[compName].stateOfChargeMin)
+            comp = compDict[compName]
+            if comp.hasCapacityVariable:
+                return (SOCInter[loc, compName, pInter] * periodSelfDischarge[compName]
+                        + SOCmin[loc, compName, periodsOrder[pInter]]
+                        >= capVar[loc, compName] * comp.stateOfChargeMin)
             else:
-                return (SOCInter[loc, compName, pInter] * (1 - compDict[compName].selfDischarge) **
-                        ((esM.timeStepsPerPeriod[-1] + 1) * esM.hoursPerTimeStep)
-                        + SOCmin[loc, compName, esM.periodsOrder[pInter]]
-                        >= compDict[compName].stateOfChargeMin)
+                return (SOCInter[loc, compName, pInter] * periodSelfDischarge[compName]
+                        + SOCmin[loc, compName, periodsOrder[pInter]]
+                        >= comp.stateOfChargeMin)
         setattr(pyM, 'ConstrSOCMinSimple_' + abbrvName,
                 pyomo.Constraint(varSimpleSet, esM.periods, rule=SOCMinSimple))
 
@@ -852,25 +884,28 @@ class StorageModel(ComponentModel):
         :type esM: esM - EnergySystemModel class instance
         """
         compDict, abbrvName = self.componentsDict, self.abbrvName
+        periodsOrder = tuple(int(p) for p in esM.periodsOrder)
         SOCinter = getattr(pyM, 'stateOfChargeInterPeriods_' + abbrvName)
         SOC, capVar = getattr(pyM, 'stateOfCharge_' + abbrvName), getattr(pyM, 'cap_' + abbrvName)
-        constrSet = getattr(pyM, 'designDimensionVarSet_' + abbrvName)
-
-        def SOCMaxPrecise(pyM, loc, compName, pInter, t):
-            if compDict[compName].doPreciseTsaModeling:
-                if not pyM.hasSegmentation:
-                    return (SOCinter[loc, compName, pInter] *
-                            ((1 - compDict[compName].selfDischarge) ** (t * esM.hoursPerTimeStep)) +
-                            SOC[loc, compName, esM.periodsOrder[pInter], t]
-                            <= capVar[loc, compName] * compDict[compName].stateOfChargeMax)
-                else:
-                    return (SOCinter[loc, compName, pInter] *
-                            ((1 - compDict[compName].selfDischarge) **
-                            (esM.segmentStartTime.to_dict()[esM.periodsOrder[pInter], t] * esM.hoursPerTimeStep)) +
-                            SOC[loc, compName, esM.periodsOrder[pInter], t]
-                            <= capVar[loc, compName] * compDict[compName].stateOfChargeMax)
-            else:
-                return pyomo.Constraint.Skip
+        constrSet = getattr(pyM, 'designDimensionVarSetPrecise_' + abbrvName)
+
+        if not pyM.hasSegmentation:
+            def SOCMaxPrecise(pyM, loc, compName, pInter, t):
+                comp = compDict[compName]
+                return (SOCinter[loc, compName, pInter] *
+                        ((1 - comp.selfDischarge) ** (t * esM.hoursPerTimeStep)) +
+                        SOC[loc, compName, periodsOrder[pInter], t]
+                        <= capVar[loc, compName] * comp.stateOfChargeMax)
+        else:
+            segmentStartTime = esM.segmentStartTime.to_dict()
+
+            def SOCMaxPrecise(pyM, loc, compName, pInter, t):
+                comp = compDict[compName]
+                return (SOCinter[loc, compName, pInter] *
+                        ((1 - comp.selfDischarge) **
+                        (segmentStartTime[periodsOrder[pInter], t] * esM.hoursPerTimeStep)) +
+                        SOC[loc, compName, periodsOrder[pInter], t]
+                        <= capVar[loc, compName] * comp.stateOfChargeMax)
         setattr(pyM, 'ConstrSOCMaxPrecise_' + abbrvName,
                 pyomo.Constraint(constrSet, esM.periods, esM.timeStepsPerPeriod, rule=SOCMaxPrecise))
 
@@ -890,31 +925,37 @@ class StorageModel(ComponentModel):
         :type esM: esM - EnergySystemModel class instance
         """
         compDict, abbrvName = self.componentsDict, self.abbrvName
+        periodsOrder = tuple(int(p) for p in esM.periodsOrder)
         SOCinter = getattr(pyM, 'stateOfChargeInterPeriods_' + abbrvName)
         SOC, capVar = getattr(pyM, 'stateOfCharge_' + abbrvName), getattr(pyM, 'cap_' + abbrvName)
         preciseSet = getattr(pyM, 'varSetPrecise_' + abbrvName)
 
-        def SOCMinPrecise(pyM, loc, compName, pInter, t):
-            if compDict[compName].hasCapacityVariable:
-                if not pyM.hasSegmentation:
-                    return (SOCinter[loc, compName, pInter] * ((1 - compDict[compName].selfDischarge) **
-                            (t * esM.hoursPerTimeStep)) + SOC[loc, compName, esM.periodsOrder[pInter], t]
-                            >= capVar[loc, compName] * compDict[compName].stateOfChargeMin)
+        if not pyM.hasSegmentation:
+            def SOCMinPrecise(pyM, loc, compName, pInter, t):
+                comp = compDict[compName]
+                if comp.hasCapacityVariable:
+                    return (SOCinter[loc, compName, pInter] * ((1 - comp.selfDischarge) **
+                            (t * esM.hoursPerTimeStep)) + SOC[loc, compName, periodsOrder[pInter], t]
+                            >= capVar[loc, compName] * comp.stateOfChargeMin)
                 else:
-                    return (SOCinter[loc, compName, pInter] * ((1 - compDict[compName].selfDischarge) **
-                            (esM.segmentStartTime.to_dict()[esM.periodsOrder[pInter], t] * esM.hoursPerTimeStep)) +
-                            SOC[loc, compName, esM.periodsOrder[pInter], t]
-                            >= capVar[loc, compName] * compDict[compName].stateOfChargeMin)
-            else:
-                if not pyM.hasSegmentation:
-                    return (SOCinter[loc, compName, pInter] * ((1 - compDict[compName].selfDischarge) **
-                            (t * esM.hoursPerTimeStep)) + SOC[loc, compName, esM.periodsOrder[pInter], t]
-                            >= compDict[compName].stateOfChargeMin)
+                    return (SOCinter[loc, compName, pInter] * ((1 - comp.selfDischarge) **
+                            (t * esM.hoursPerTimeStep)) + SOC[loc, compName, periodsOrder[pInter], t]
+                            >= comp.stateOfChargeMin)
+        else:
+            segmentStartTime = esM.segmentStartTime.to_dict()
+
+            def SOCMinPrecise(pyM, loc, compName, pInter, t):
+                comp = compDict[compName]
+                if comp.hasCapacityVariable:
+                    return (SOCinter[loc, compName, pInter] * ((1 - comp.selfDischarge) **
+                            (segmentStartTime[periodsOrder[pInter], t] * esM.hoursPerTimeStep)) +
+                            SOC[loc, compName, periodsOrder[pInter], t]
+                            >= capVar[loc, compName] * comp.stateOfChargeMin)
                 else:
-                    return (SOCinter[loc, compName, pInter] * ((1 - compDict[compName].selfDischarge) **
-                            (esM.segmentStartTime.to_dict()[esM.periodsOrder[pInter], t] * esM.hoursPerTimeStep)) +
-                            SOC[loc, compName, esM.periodsOrder[pInter], t]
-                            >= compDict[compName].stateOfChargeMin)
+                    return (SOCinter[loc, compName, pInter] * ((1 - comp.selfDischarge) **
+                            (segmentStartTime[periodsOrder[pInter], t] * esM.hoursPerTimeStep)) +
+                            SOC[loc, compName, periodsOrder[pInter], t]
+                            >= comp.stateOfChargeMin)
         setattr(pyM, 'ConstrSOCMinPrecise_' + abbrvName,
                 pyomo.Constraint(preciseSet, esM.periods, esM.timeStepsPerPeriod, rule=SOCMinPrecise))
 
@@ -965,7 +1006,7 @@ class StorageModel(ComponentModel):
         # the hours per time step [h] and the charging operation time series [1/h]
         self.operationMode3(pyM, esM, 'ConstrCharge', 'chargeOpConstrSet', 'chargeOp', 'processedChargeOpRateMax')
         # Operation [commodityUnit*h] is equal to the operation time series [commodityUnit*h]
-        self.operationMode4(pyM, esM, 'ConstrCharge', 'chargeOpConstrSet', 'chargeOp', 'processedCchargeOpRateFix')
+        self.operationMode4(pyM, esM, 'ConstrCharge', 'chargeOpConstrSet', 'chargeOp', 'processedChargeOpRateFix')
         # Operation [commodityUnit*h] is limited by the operation time series [commodityUnit*h]
         self.operationMode5(pyM, esM, 'ConstrCharge', 'chargeOpConstrSet', 'chargeOp', 'processedChargeOpRateMax')
         # Operation [physicalUnit*h] is limited by minimum part Load
@@ -1056,8 +1097,13 @@ class StorageModel(ComponentModel):
         :param commod: Name of the regarded commodity (commodities are defined in the EnergySystemModel instance)
         :param commod: string
         """
-        return any([comp.commodity == commod and comp.locationalEligibility[loc] == 1
-                    for comp in self.componentsDict.values()])
+        # While the optimization problem is declared, the components connected to a commodity at a location are
+        # already grouped in the pyomo model (cf. declareSets)
+        opVarDictCommodity = getattr(esM.pyM, 'operationVarDictCommodity_' + self.abbrvName, None)
+        if opVarDictCommodity is not None:
+            return len(opVarDictCommodity[loc, commod]) > 0
+        return any(comp.commodity == commod and comp.locationalEligibility[loc] == 1
+                   for comp in self.componentsDict.values())
 
     def getCommodityBalanceContribution(self, pyM, commod, loc, p, t):
         """ 
@@ -1068,11 +1114,11 @@ class StorageModel(ComponentModel):
             \\text{C}^{comp,comm}_{loc,p,t} = op^{comp,discharge}_{loc,p,t} - op^{comp,charge}_{loc,p,t}
         
         """
-        compDict, abbrvName = self.componentsDict, self.abbrvName
+        abbrvName = self.abbrvName
         chargeOp, dischargeOp = getattr(pyM, 'chargeOp_' + abbrvName), getattr(pyM, 'dischargeOp_' + abbrvName)
-        opVarDict = getattr(pyM, 'operationVarDict_' + abbrvName)
+        opVarDictCommodity = getattr(pyM, 'operationVarDictCommodity_' + abbrvName)
         return sum(dischargeOp[loc, compName, p, t] - chargeOp[loc, compName, p, t]
-                   for compName in opVarDict[loc] if commod == self.componentsDict[compName].commodity)
+                   for compName in opVarDictCommodity[loc, commod])
 
     def getObjectiveFunctionContribution(self, esM, pyM):
         """
@@ -1095,10 +1141,11 @@ class StorageModel(ComponentModel):
 
         offsetUp = getattr(pyM, 'stateOfChargeOffsetUp_' + abbrvName)
         offsetDown = getattr(pyM, 'stateOfChargeOffsetDown_' + abbrvName)
-        offsetUpOp = sum(offsetUp[loc, compName, period]*compDict[compName].socOffsetUp
-            for loc, compName, period in offsetUp)        
-        offsetDownOp = sum(offsetDown[loc, compName, period]*compDict[compName].socOffsetDown
-            for loc, compName, period in offsetDown)
+        socOffsetUp = {compName: comp.socOffsetUp for compName, comp in compDict.items()}
+        socOffsetDown = {compName: comp.socOffsetDown for compName, comp in compDict.items()}
+        offsetUpOp = pyomo.quicksum(var * socOffsetUp[compName] for (loc, compName, period), var in offsetUp.items())
+        offsetDownOp = pyomo.quicksum(var * socOffsetDown[compName]
+                                      for (loc, compName, period), var in offsetDown.items())
 
         return capexCap + capexDec + opexCap + opexDec + opexOp1 + opexOp2 + offsetUpOp + offsetDownOp
 
@@ -1131,12 +1178,9 @@ class StorageModel(ComponentModel):
                  props[2]: ['[' + esM.costUnit + '/a]'],
                  props[3]: ['[' + esM.costUnit + '/a]']}
         # Create tuples for the optSummary's multiIndex. Combine component with the respective properties and units.
-        tuples = [(compName, prop, unit) for compName in compDict.keys() for prop in props for unit in units[prop]]
-        # Replace placeholder with correct unit of component
-        tuples = list(map(lambda x: (x[0], x[1], x[2].replace("-", compDict[x[0]].commodityUnit))
-            if x[1] == 'operationCharge' else x, tuples))
-        tuples = list(map(lambda x: (x[0], x[1], x[2].replace("-", compDict[x[0]].commodityUnit))
-            if x[1] == 'operationDischarge' else x, tuples))
+        # For the operation properties, the placeholder is replaced with the correct unit of the component.
+        tuples = [(compName, prop, unit.replace("-", comp.commodityUnit) if prop in props[:2] else unit)
+                  for compName, comp in compDict.items() for prop in props for unit in units[prop]]
         mIndex = pd.MultiIndex.from_tuples(tuples, names=['Component', 'Property', 'Unit'])
         optSummary = pd.DataFrame(index=mIndex, columns=sorted(esM.locations)).sort_index()
 
@@ -1147,7 +1191,8 @@ class StorageModel(ComponentModel):
 
         if optVal is not None:
             opSum = optVal.sum(axis=1).unstack(-1)
-            ox = opSum.apply(lambda op: op * compDict[op.name].opexPerChargeOperation[op.index], axis=1)
+            opex = np.array([compDict[compName].opexPerChargeOperation[opSum.columns] for compName in opSum.index])
+            ox = opSum * opex
             optSummary.loc[[(ix, 'operationCharge', '[' + compDict[ix].commodityUnit + '*h/a]')
                              for ix in opSum.index], opSum.columns] = opSum.values/esM.numberOfYears
             optSummary.loc[[(ix, 'operationCharge', '[' + compDict[ix].commodityUnit + '*h]')
@@ -1171,7 +1216,8 @@ class StorageModel(ComponentModel):
 
         if optVal is not None:
             opSum = optVal.sum(axis=1).unstack(-1)
-            ox = opSum.apply(lambda op: op * compDict[op.name].opexPerDischargeOperation[op.index], axis=1)
+            opex = np.array([compDict[compName].opexPerDischargeOperation[opSum.columns] for compName in opSum.index])
+            ox = opSum * opex
             optSummary.loc[[(ix, 'operationDischarge', '[' + compDict[ix].commodityUnit + '*h/a]')
                              for ix in opSum.index], opSum.columns] = opSum.values/esM.numberOfYears
             optSummary.loc[[(ix, 'operationDischarge', '[' + compDict[ix].commodityUnit + '*h]')
@@ -1193,36 +1239,39 @@ class StorageModel(ComponentModel):
             stateOfChargeIntra = SOC.get_values()
             stateOfChargeInter = SOCinter.get_values()
             if stateOfChargeIntra is not None:
-                # Convert dictionary to DataFrame, transpose, put the period column first and sort the index
-                # Results in a one dimensional DataFrame
-                stateOfChargeIntra = pd.DataFrame(stateOfChargeIntra, index=[0]).T.swaplevel(i=0, j=-2).sort_index()
-                stateOfChargeInter = pd.DataFrame(stateOfChargeInter, index=[0]).T.swaplevel(i=0, j=1).sort_index()
+                # Convert dictionary to Series, put the period level first and sort the index
+                stateOfChargeIntra = pd.Series(stateOfChargeIntra).swaplevel(i=0, j=-2).sort_index()
+                stateOfChargeInter = pd.Series(stateOfChargeInter).swaplevel(i=0, j=1).sort_index()
                 # Unstack time steps (convert to a two dimensional DataFrame with the time indices being the columns)
                 stateOfChargeIntra = stateOfChargeIntra.unstack(level=-1)
                 stateOfChargeInter = stateOfChargeInter.unstack(level=-1)
-                # Get rid of the unnecessary 0 level
-                stateOfChargeIntra.columns = stateOfChargeIntra.columns.droplevel()
-                stateOfChargeInter.columns = stateOfChargeInter.columns.droplevel()
                 # If segmentation is chosen, the segments of each period need to be unravelled to the original number of
                 # time steps first
+                typicalPeriods = stateOfChargeIntra.index.get_level_values(0).unique()
                 if esM.segmentation:
-                    dataAllPeriods = []
-                    for p in esM.typicalPeriods:
-                        # Repeat each segment in each period as often as time steps are represented by the corresponding
-                        # segment
-                        repList = esM.timeStepsPerSegment.loc[p, :].tolist()
-                        dataPeriod = pd.DataFrame(np.repeat(stateOfChargeIntra.loc[p].loc[:, :esM.segmentsPerPeriod[-1]].values, repList, axis=1),
-                                                  index=stateOfChargeIntra.xs(p, level=0, drop_level=False).index)
-                        dataAllPeriods.append(dataPeriod)
-                    # Concat data to multiindex dataframe with periods, components and locations as indices and inner-
-                    # period time steps as columns
-                    stateOfChargeIntra = pd.concat(dataAllPeriods, axis=0)
-                # Concat data according to periods order to cover the full time horizon
-                data = []
-                for count, p in enumerate(esM.periodsOrder):
-                    data.append((stateOfChargeInter.loc[:, count] +
-                                 stateOfChargeIntra.loc[p].loc[:, :esM.timeStepsPerPeriod[-1]].T).T)
-                optVal = pd.concat(data, axis=1, ignore_index=True)
+                    # Repeat each segment in each period as often as time steps are represented by the corresponding
+                    # segment: the segment indices of all periods are gathered to one (typical period, time step)
+                    # array with which the segment values of all periods are indexed at once
+                    numberOfSegments = len(esM.segmentsPerPeriod)
+                    segmentIndices = np.repeat(np.tile(np.arange(numberOfSegments), len(typicalPeriods)),
+                                               esM.timeStepsPerSegment.sort_index().values)
+                    segmentValues = stateOfChargeIntra.loc[:, :esM.segmentsPerPeriod[-1]].values.reshape(
+                        len(typicalPeriods), -1, numberOfSegments)
+                    data = np.take_along_axis(segmentValues,
+                                              segmentIndices.reshape(len(typicalPeriods), 1, -1), axis=2)
+                    # Data with periods, components and locations as indices and inner-period time steps as columns
+                    stateOfChargeIntra = pd.DataFrame(data.reshape(len(stateOfChargeIntra), -1),
+                                                      index=stateOfChargeIntra.index)
+                # Arrange the data according to periods order to cover the full time horizon: the intra-period
+                # states of charge of the typical periods are stacked to an array (typical period, component and
+                # location, time step) which is indexed with the periods order and the inter-period states of charge
+                # at the beginning of each period are added
+                stateOfChargeIntra = stateOfChargeIntra.loc[:, :esM.timeStepsPerPeriod[-1]]
+                intraValues = stateOfChargeIntra.values.reshape(len(typicalPeriods), len(stateOfChargeInter), -1)
+                interValues = stateOfChargeInter.values[:, :len(esM.periodsOrder)]
+                data = intraValues[typicalPeriods.get_indexer(esM.periodsOrder)] + interValues.T[:, :, np.newaxis]
+                optVal = pd.DataFrame(data.transpose(1, 0, 2).reshape(len(stateOfChargeInter), -1),
+                                      index=stateOfChargeInter.index)
             else:
                 optVal = None
             self.stateOfChargeOperationVariablesOptimum = optVal
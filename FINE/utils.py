@@ -580,7 +580,7 @@ def checkAndSetTimeSeries(esM, name, operationTimeSeries, locationalEligibility,
 
             if locationalEligibility is not None:
                 # Check if given capacities indicate the same eligibility
-                data = operationTimeSeries.copy().sum()
+                data = operationTimeSeries.sum()
                 data[data > 0] = 1
                 if (data > locationalEligibility).any().any():
                     raise ValueError('The locationalEligibility and ' + name + ' parameters indicate different' +
@@ -615,7 +615,6 @@ def checkAndSetTimeSeries(esM, name, operationTimeSeries, locationalEligibility,
             raise ValueError('Value error in ' + name + ' detected.\n' +
                             'All entries in operationTimeSeries parameter series have to be positive.')
 
-        _operationTimeSeries = _operationTimeSeries.copy()		
         _operationTimeSeries["Period"], _operationTimeSeries["TimeStep"] = 0, _operationTimeSeries.index		
         return _operationTimeSeries.set_index(['Period', 'TimeStep'])
             
@@ -0,0 +1,22 @@
+import FINE as fn
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_storagePartLoadMin(minimal_test_esM):
+    '''
+    Check that a storage component is rejected if its charge operation rate time series contains values between 0 and
+    partLoadMin, while zeros and values above partLoadMin are accepted.
+    '''
+    esM = minimal_test_esM
+    locations = ['ElectrolyzerLocation', 'IndustryLocation']
+
+    chargeOpRateMax = pd.DataFrame([np.array([0., 0.5, 1., 1.]), np.array([1., 1., 0., 0.6])], index=locations).T
+    esM.add(fn.Storage(esM=esM, name='Storage valid', commodity='hydrogen', partLoadMin=0.5, bigM=1e6,
+                       chargeOpRateMax=chargeOpRateMax))
+
+    chargeOpRateMax.loc[1, 'IndustryLocation'] = 0.2
+    with pytest.raises(ValueError, match='partLoadMin'):
+        fn.Storage(esM=esM, name='Storage invalid', commodity='hydrogen', partLoadMin=0.5, bigM=1e6,
+                   chargeOpRateMax=chargeOpRateMax)
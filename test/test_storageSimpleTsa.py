@@ -0,0 +1,18 @@
+import FINE as fn
+
+
+def test_storageSimpleTsaWithoutCapacityVariable(minimal_test_esM):
+    '''
+    Check that a storage without capacity variable can be optimized with the simplified time series aggregation
+    modeling and that the capacity dependent state of charge limit is only declared for storages with a capacity
+    variable.
+    '''
+    esM = minimal_test_esM
+    esM.add(fn.Storage(esM=esM, name='Cavern', commodity='hydrogen', hasCapacityVariable=False))
+
+    esM.cluster(numberOfTypicalPeriods=2, numberOfTimeStepsPerPeriod=2, storeTSAinstance=False,
+                clusterMethod='hierarchical', sortValues=False, rescaleClusterPeriods=False)
+    esM.optimize(timeSeriesAggregation=True, solver='glpk')
+
+    constrSet = {compName for loc, compName, p in esM.pyM.ConstrSOCMaxSimple_stor}
+    assert constrSet == {'Pressure tank'}